@@ -4,12 +4,10 @@
 Tests for Task 2
 """
 
-import dotenv
+from tasks import load_config, mongodb_crud_cli
 
-from tasks import mongodb_crud_cli
 
-
-config = dotenv.dotenv_values(".env")
+config = load_config(".env")
 
 
 if __name__ == "__main__":
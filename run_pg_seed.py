@@ -4,12 +4,10 @@
 Tests for Task 1 Create DB script
 """
 
-import dotenv
+from tasks import load_config, config_flag, console_logger, seed
 
-from tasks import console_logger, seed
 
-
-config = dotenv.dotenv_values(".env")
+config = load_config(".env")
 
 
 if __name__ == "__main__":
@@ -20,4 +18,5 @@ if __name__ == "__main__":
         config["PG_PASSWORD"],
         config["PG_DBNAME"],
         logger=console_logger(__name__),
+        use_external_pooler=config_flag(config, "PG_EXTERNAL_POOLER"),
     )
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+"""
+Configuration loading
+"""
+
+import functools
+import os
+from typing import Mapping, Optional
+
+import dotenv
+
+
+# Keys expected in the configuration (see .env_example)
+CONFIG_KEYS = (
+    "PG_HOST",
+    "PG_PORT",
+    "PG_USER",
+    "PG_PASSWORD",
+    "PG_DBNAME",
+    "MONGODB_URI",
+    "MONGODB_DBNAME",
+)
+
+# Optional keys of the configuration
+OPTIONAL_CONFIG_KEYS = (
+    "PG_EXTERNAL_POOLER",
+)
+
+# Values of a boolean key treated as True
+TRUE_VALUES = ("1", "true", "yes", "on")
+
+
+@functools.lru_cache(maxsize=1)
+def load_config(path: str = ".env") -> dict[str, Optional[str]]:
+    """
+    Load the configuration once per process.
+    Environment variables override values from the .env file; the file is not parsed at all
+    if every expected key (including the optional ones) is already set in the environment.
+
+    :param path: Path to the .env file
+    :return: Configuration dictionary
+    """
+    if all(key in os.environ for key in CONFIG_KEYS + OPTIONAL_CONFIG_KEYS):
+        return dict(os.environ)
+    return {**dotenv.dotenv_values(path), **os.environ}
+
+
+def config_flag(config: Mapping[str, Optional[str]], key: str, default: bool = False) -> bool:
+    """
+    Read a boolean value of the configuration, like "true", "1", "yes" or "on" (case-insensitive).
+
+    :param config: Configuration dictionary
+    :param key: Key
+    :param default: Value if the key is not set or empty
+    :return: Boolean value
+    """
+    value = config.get(key)
+    if not value:
+        return default
+    return value.strip().lower() in TRUE_VALUES
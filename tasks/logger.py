@@ -10,10 +10,14 @@ from typing import Optional
 
 def console_logger(name: Optional[str]) -> logging.Logger:
     logger = logging.getLogger(name or __name__)
-    logger.setLevel(logging.INFO)
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.INFO)
-    formatter = logging.Formatter("%(asctime)s\t%(levelname)s\t%(message)s")
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    # Configure the logger once, repeated calls must not add more handlers
+    if not logger.handlers:
+        logger.setLevel(logging.INFO)
+        console_handler = logging.StreamHandler()
+        console_handler.setLevel(logging.INFO)
+        formatter = logging.Formatter("%(asctime)s\t%(levelname)s\t%(message)s")
+        console_handler.setFormatter(formatter)
+        logger.addHandler(console_handler)
+        # The record is already printed by the own handler, do not print it again through the root logger
+        logger.propagate = False
     return logger
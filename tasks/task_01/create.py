@@ -7,20 +7,36 @@ Database and tables create script
 import logging
 from typing import Optional
 
+import psycopg_pool
+
 from .postgress import PgConfig, PostgresClient, DuplicateDatabase, DatabaseError
 
 
-def create_database(host: str, port: int, user: str, password: str, dbname: str, logger: logging.Logger) -> bool:
+# Databases known to exist (server DSN, database name), a database does not disappear during a run
+_existing_databases: set[tuple[str, str]] = set()
+
+
+def create_database(pg_client: PostgresClient, dbname: str, logger: logging.Logger) -> bool:
     """
     Creates the database if it does not exist.
+
+    :param pg_client: Database connection class (connected to the "postgres" maintenance database, autocommit)
+    :param dbname: Database name
+    :param logger: Logger class
+    :return: Success status
     """
-    pg_client = PostgresClient(
-        PgConfig(dsn=f"postgresql://{user}:{password}@{host}:{port}/postgres", autocommit=True, min_size=1, max_size=5)
-    )
+    key = (pg_client.dsn, dbname)
+    if key in _existing_databases:
+        logger.info(f"The database \"{dbname}\" already exists.")
+        return True
 
     try:
-        exists = pg_client.fetchone("select EXISTS( SELECT 1 FROM pg_database WHERE datname = %s);", (dbname,))
-        if not  exists.get('exists', False):
+        # CREATE DATABASE cannot run inside a transaction block (or a DO block), so check first
+        # Runs at most once per process (see _existing_databases), preparing it would only add a round-trip
+        exists = pg_client.fetch_scalar(
+            "select EXISTS( SELECT 1 FROM pg_database WHERE datname = %s);", (dbname,), prepare=None
+        )
+        if not exists:
             logger.warning(f"The database \"{dbname}\" does not exist. Creating it.")
             try:
                 pg_client.execute(f"CREATE DATABASE \"{dbname}\" ENCODING \"UTF8\"")
@@ -30,12 +46,11 @@ def create_database(host: str, port: int, user: str, password: str, dbname: str,
         else:
             logger.info(f"The database \"{dbname}\" already exists.")
 
+        _existing_databases.add(key)
         return True
     except Exception as e:
         logger.error(e)
         return False
-    finally:
-        pg_client.close()
 
 
 def create_table(pg_client: PostgresClient, sql: str, logger: logging.Logger) -> bool:
@@ -56,17 +71,17 @@ def create_table(pg_client: PostgresClient, sql: str, logger: logging.Logger) ->
         return False
 
 
-def create_tables(host: str, port: int, user: str, password: str, dbname: str, logger: logging.Logger) -> bool:
+def create_tables(pg_client: PostgresClient, logger: logging.Logger) -> bool:
     """
     Creates tables.
-    """
-    pg_client = PostgresClient(
-        PgConfig(dsn=f"postgresql://{user}:{password}@{host}:{port}/{dbname}", min_size=1, max_size=5)
-    )
 
+    :param pg_client: Database connection class
+    :param logger: Logger class
+    :return: Success status
+    """
     try:
-        # Create  table: users
-        if create_table(
+        # Create tables: users, status (with its values) and tasks (referencing users and status) in one round-trip
+        if not create_table(
                 pg_client,
                 """
                 CREATE TABLE IF NOT EXISTS users (
@@ -75,31 +90,14 @@ def create_tables(host: str, port: int, user: str, password: str, dbname: str, l
                     email VARCHAR(100) NOT NULL,
                     CONSTRAINT uq_users_email UNIQUE (email)
                 );
-                """,
-                logger
-        ):
-            logger.info("The table \"users\" created.")
 
-        # Create  table: status
-        if create_table(
-                pg_client,
-                """
                 CREATE TABLE IF NOT EXISTS status (
                     id SERIAL PRIMARY KEY,
                     name VARCHAR(50) NOT NULL CHECK (name IN ('new', 'in progress', 'completed')),
                     CONSTRAINT uq_status_name UNIQUE (name)
                 );
                 INSERT INTO status (name) VALUES ('new'), ('in progress'), ('completed') ON CONFLICT (name) DO NOTHING;
-                """,
-                logger
-        ):
-            logger.info("The table \"status\" created.")
-
 
-        # Create  table: tasks
-        if create_table(
-                pg_client,
-                """
                 CREATE TABLE IF NOT EXISTS tasks (
                     id          SERIAL PRIMARY KEY,
                     title       VARCHAR(100) NOT NULL,
@@ -124,14 +122,21 @@ def create_tables(host: str, port: int, user: str, password: str, dbname: str, l
                 """,
                 logger
         ):
-            logger.info("The table \"tasks\" created.")
-
-        return True
+            return False
+
+        tables = set(pg_client.fetch_column("SELECT tablename FROM pg_tables WHERE schemaname = 'public';"))
+        success = True
+        for table in ("users", "status", "tasks"):
+            if table in tables:
+                logger.info(f"The table \"{table}\" created.")
+            else:
+                logger.error(f"The table \"{table}\" has not been created.")
+                success = False
+
+        return success
     except Exception as e:
         logger.error(e)
         return False
-    finally:
-        pg_client.close()
 
 
 def create(
@@ -141,8 +146,24 @@ def create(
         password: str,
         dbname: str,
         logger: Optional[logging.Logger] = None,
+        use_external_pooler: bool = False,
 ) -> None:
     if logger is None:
         logger = logging.getLogger(__name__)
-    if create_database(host, int(port), user, password, dbname, logger):
-        create_tables(host, int(port), user, password, dbname, logger)
+    try:
+        server_client = PostgresClient.get_or_create(
+            PgConfig(
+                dsn=f"postgresql://{user}:{password}@{host}:{port}/postgres", autocommit=True, min_size=1, max_size=5,
+                use_external_pooler=use_external_pooler,
+            )
+        )
+        if create_database(server_client, dbname, logger):
+            pg_client = PostgresClient.get_or_create(
+                PgConfig(
+                    dsn=f"postgresql://{user}:{password}@{host}:{port}/{dbname}", min_size=1, max_size=5,
+                    use_external_pooler=use_external_pooler,
+                )
+            )
+            create_tables(pg_client, logger)
+    except psycopg_pool.PoolTimeout as e:
+        logger.error(e)
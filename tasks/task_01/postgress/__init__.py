@@ -4,5 +4,6 @@ __title__ = 'PostgreSQL Client'
 __author__ = 'Roman'
 
 from .client import PgConfig, PostgresClient, DuplicateDatabase, DatabaseError
+from .async_client import AsyncPostgresClient
 
-__all__ = ['PgConfig', 'PostgresClient', 'DuplicateDatabase', 'DatabaseError']
+__all__ = ['PgConfig', 'PostgresClient', 'AsyncPostgresClient', 'DuplicateDatabase', 'DatabaseError']
@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+
+"""
+PostgreSQL asynchronous Client (psycopg 3)
+"""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Iterable, Mapping, Optional, Sequence
+
+import psycopg
+import psycopg_pool
+
+from .client import PgConfig
+
+
+class AsyncPostgresClient:
+    """
+    PostgreSQL asynchronous client with a connection pool (psycopg 3).
+
+    Intended for concurrent workloads: the pool should allow at least the number of concurrent tasks + 2
+    connections (PgConfig.max_size), otherwise the tasks wait for a free connection.
+
+    Support:
+      - parameterized queries
+      - transactions using an asynchronous context manager
+      - fetch/execute methods
+
+    Usage:
+        async with AsyncPostgresClient(config) as pg_client:
+            rows = await pg_client.fetchall("SELECT ...")
+    """
+
+    def __init__(self, config: PgConfig):
+        self._config = config
+        # The pool is opened with open(), it requires a running event loop
+        self._pool = psycopg_pool.AsyncConnectionPool(
+            conninfo=config.dsn,
+            configure=config.setup_async_session,
+            min_size=config.pool_min_size,
+            max_size=config.pool_max_size,
+            timeout=config.timeout,
+            num_workers=config.num_workers,
+            max_lifetime=config.max_lifetime,
+            max_idle=config.max_idle,
+            kwargs=config.connection_kwargs,
+            open=False,
+        )
+
+    async def open(self) -> None:
+        """
+        Open the pool and wait for min_size connections.
+        """
+        await self._pool.open(wait=True, timeout=self._config.timeout)
+
+    async def close(self) -> None:
+        """
+        Close the pool (when shutting down the service).
+        """
+        await self._pool.close()
+
+    async def __aenter__(self) -> AsyncPostgresClient:
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        await self.close()
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[psycopg.AsyncConnection]:
+        """
+        Provide a raw connection from the pool (if low-level access is needed).
+
+        :return: Raw connection.
+        """
+        async with self._pool.connection() as conn:
+            yield conn
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[Optional[psycopg.AsyncCursor[Any]]]:
+        """
+        Transaction with commit/rollback.
+        Any error (database or raised in the block) rolls the transaction back,
+        the autocommit mode of the connection is restored before returning it to the pool.
+        """
+        async with self._pool.connection() as conn:
+            autocommit = conn.autocommit
+            if autocommit:
+                await conn.set_autocommit(False)
+            try:
+                async with conn.cursor() as cur:
+                    yield cur
+                await conn.commit()
+            except BaseException:
+                await conn.rollback()
+                raise
+            finally:
+                await conn.set_autocommit(autocommit)
+
+    # ----------------------------------------------------- helpers ----------------------------------------------------
+
+    async def execute(
+            self,
+            sql: str,
+            params: Optional[Sequence[Any] | Mapping[str, Any]] = None,
+            prepare: Optional[bool] = None,
+    ) -> int:
+        """
+        Execute DML SQL statement (INSERT/UPDATE/DELETE).
+
+        :param sql: SQL with placeholders (%s or %(name)s)
+        :param params: Parameter values
+        :param prepare: Prepare the statement on the server (None - automatically after repeated executions).
+                        Only a single DML statement can be prepared, not DDL or a multi-statement script.
+        :return: Number of rows affected.
+        """
+        async with self._pool.connection() as conn, conn.cursor() as cur:
+            await cur.execute(sql, params, prepare=self._config.prepare_mode(prepare))
+            if not conn.autocommit:
+                await conn.commit()
+            return cur.rowcount or 0
+
+    async def executemany(self, sql: str, seq_of_params: Iterable[Sequence[Any] | Mapping[str, Any]]) -> int:
+        """
+        Execute the same DML SQL statement multiple times with different parameters.
+
+        :param sql: SQL with placeholders (%s or %(name)s)
+        :param seq_of_params: Set of parameter values
+        :return: Number of rows affected.
+        """
+        async with self._pool.connection() as conn, conn.cursor() as cur:
+            await cur.executemany(sql, seq_of_params)
+            if not conn.autocommit:
+                await conn.commit()
+            return cur.rowcount or 0
+
+    async def fetchone(
+            self,
+            sql: str,
+            params: Optional[Sequence[Any] | Mapping[str, Any]] = None,
+            prepare: Optional[bool] = None,
+    ) -> Optional[dict[str, Any]]:
+        """
+        Fetch a single row (as a dictionary) or None.
+
+        :param sql: SQL with placeholders (%s or %(name)s)
+        :param params: Parameter values
+        :param prepare: Prepare the statement on the server (None - automatically after repeated executions,
+                        True - force it for a hot statement, at the cost of an extra round-trip on first use)
+        :return: Row data or None
+        """
+        async with self._pool.connection() as conn, conn.cursor() as cur:
+            await cur.execute(sql, params, prepare=self._config.prepare_mode(prepare))
+            return await cur.fetchone()
+
+    async def fetchall(
+            self,
+            sql: str,
+            params: Optional[Sequence[Any] | Mapping[str, Any]] = None,
+            prepare: Optional[bool] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Fetch all rows (as a list of dictionary).
+
+        :param sql: SQL with placeholders (%s or %(name)s)
+        :param params: Parameter values
+        :param prepare: Prepare the statement on the server (None - automatically after repeated executions,
+                        True - force it for a hot statement, at the cost of an extra round-trip on first use)
+        :return: List of all rows data
+        """
+        async with self._pool.connection() as conn, conn.cursor() as cur:
+            await cur.execute(sql, params, prepare=self._config.prepare_mode(prepare))
+            return await cur.fetchall()
@@ -4,40 +4,92 @@
 Populate data with fake values script
 """
 
+import functools
 import logging
 import random
 from typing import Optional, Any
 
 import faker
+import psycopg
+import psycopg_pool
 
+from .postgress import PgConfig, PostgresClient
 
-from .postgress import PgConfig, PostgresClient, DatabaseError
+
+# Maximum sizes of the pools of Faker values sampled for large data sets
+USERS_POOL_SIZE = 1000
+WORDS_POOL_SIZE = 5000
+# Maximum number of words in a task sentence
+SENTENCE_MAX_WORDS = 10
+
+
+def _unique_email(email: str, index: int) -> str:
+    """
+    Make an email unique by adding the record index to its local part (like "name+1234@example.com").
+
+    :param email: Email
+    :param index: Record index
+    :return: Unique email
+    """
+    local, _, domain = email.partition("@")
+    return f"{local}+{index}@{domain}"
+
+
+def _sentence(words: list[str], words_number: int, rng: random.Random) -> str:
+    """
+    Build a sentence from random words of the pool.
+
+    :param words: Words pool
+    :param words_number: Number of words in the sentence
+    :param rng: Random generator
+    :return: Sentence
+    """
+    return " ".join(rng.sample(words, words_number)).capitalize() + "."
 
 
 def generate_fake_data(
         users_number: int = 5,
         tasks_number: int = 25,
+        rng: Optional[random.Random] = None,
 ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
     """
     Generating fake data.
+    Faker generates at most USERS_POOL_SIZE users, the rest of the users are sampled from them
+    (with the record index added to the email, the email must be unique). Task texts are built
+    from a pool of words sized by the number of tasks.
 
     :param users_number: Number of users
     :param tasks_number: Number of tasks
+    :param rng: Random generator for sampling the pools (seeded with 42 if not given)
     :return: Lists of fake users and tasks
     """
-    fake_users = []
-    fake_tasks = []
+    if rng is None:
+        rng = random.Random(42)
 
     fake = faker.Faker("uk_UA")
     fake.seed_instance(42)
 
-    for _ in range(users_number):
-        fake_users.append(dict(fullname=fake.name(), email=fake.email()))
-
-    for _ in range(tasks_number):
-        fake_tasks.append(
-            dict(title=fake.sentence(nb_words=5), description=fake.paragraph(nb_sentences=3))
+    fake_users = []
+    emails = set()
+    for index in range(min(users_number, USERS_POOL_SIZE)):
+        fullname, email = fake.name(), fake.email()
+        if email in emails:
+            email = _unique_email(email, index)
+        emails.add(email)
+        fake_users.append(dict(fullname=fullname, email=email))
+    pool = fake_users.copy()
+    for index in range(len(pool), users_number):
+        user = rng.choice(pool)
+        fake_users.append(dict(fullname=user["fullname"], email=_unique_email(user["email"], index)))
+
+    words = fake.words(nb=max(SENTENCE_MAX_WORDS, min(tasks_number, WORDS_POOL_SIZE)))
+    fake_tasks = [
+        dict(
+            title=_sentence(words, 5, rng),
+            description=" ".join(_sentence(words, rng.randint(4, SENTENCE_MAX_WORDS), rng) for _ in range(3)),
         )
+        for _ in range(tasks_number)
+    ]
 
     return fake_users, fake_tasks
 
@@ -52,13 +104,19 @@ def fill_users_data(pg_client: PostgresClient, users: list[dict[str, Any]], logg
     :return: Success status
     """
     try:
-        affected_rows = pg_client.executemany(
-            "INSERT INTO users (fullname, email) VALUES(%(fullname)s, %(email)s) ON CONFLICT (email) DO NOTHING;",
-            users
-        )
+        with pg_client.transaction() as cur:
+            # Seed data is not critical: do not wait for the WAL flush on commit
+            cur.execute("SET LOCAL synchronous_commit = OFF;")
+            affected_rows = pg_client.insert_many(
+                "users",
+                ("fullname", "email"),
+                ((user["fullname"], user["email"]) for user in users),
+                on_conflict="ON CONFLICT (email) DO NOTHING",
+                cur=cur,
+            )
         logger.info(f"Data for {affected_rows} of {len(users)} users has been added to the database.")
         return True
-    except DatabaseError as e:
+    except psycopg.Error as e:
         logger.error(e)
         return False
 
@@ -70,44 +128,61 @@ def get_users_ids(pg_client: PostgresClient) -> list[int]:
     :param pg_client: Database connection class
     :return: List of user IDs
     """
-    users = pg_client.fetchall("SELECT id FROM users")
-    return [user.get('id') for user in users if user.get('id') is not None]
+    return pg_client.fetch_column("SELECT id FROM users")
 
 
-def get_status_ids(pg_client: PostgresClient) -> list[int]:
+@functools.lru_cache(maxsize=8)
+def get_status_ids(pg_client: PostgresClient) -> tuple[int, ...]:
     """
-    Return list of status IDs.
+    Return status IDs.
+    The status table is a fixed set of values, so the IDs are fetched once per client.
 
     :param pg_client: Database connection class
-    :return: List of status IDs
+    :return: Tuple of status IDs
     """
-    users = pg_client.fetchall("SELECT id FROM status")
-    return [user.get('id') for user in users if user.get('id') is not None]
+    return tuple(pg_client.fetch_column("SELECT id FROM status"))
 
 
-def fill_tasks_data(pg_client: PostgresClient, tasks: list[dict[str, Any]], logger: logging.Logger) -> bool:
+def fill_tasks_data(
+        pg_client: PostgresClient,
+        tasks: list[dict[str, Any]],
+        logger: logging.Logger,
+        rng: Optional[random.Random] = None,
+) -> bool:
     """
     Insert users data into the database.
 
     :param pg_client: Database connection class
     :param tasks: List of tasks data
     :param logger: Logger class
+    :param rng: Random generator for assigning statuses and users (seeded with 42 if not given)
     :return: Success status
     """
+    if rng is None:
+        rng = random.Random(42)
+
     try:
         users_ids = get_users_ids(pg_client)
         status_ids = get_status_ids(pg_client)
-        for task in tasks:
-            task['status_id'] = random.choice(status_ids)
-            task['user_id'] = random.choice(users_ids)
-
-        affected_rows = pg_client.executemany(
-            "INSERT INTO tasks (title, description, status_id, user_id) VALUES(%(title)s, %(description)s, %(status_id)s, %(user_id)s);",
-            tasks
-        )
+        tasks_status_ids = rng.choices(status_ids, k=len(tasks))
+        tasks_users_ids = rng.choices(users_ids, k=len(tasks))
+
+        with pg_client.transaction() as cur:
+            # Seed data is not critical: do not wait for the WAL flush on commit
+            cur.execute("SET LOCAL synchronous_commit = OFF;")
+            affected_rows = pg_client.insert_many_unnest(
+                "tasks",
+                ("title", "description", "status_id", "user_id"),
+                ("text", "text", "int", "int"),
+                (
+                    (task["title"], task["description"], status_id, user_id)
+                    for task, status_id, user_id in zip(tasks, tasks_status_ids, tasks_users_ids)
+                ),
+                cur=cur,
+            )
         logger.info(f"Data for {affected_rows} of {len(tasks)} tasks has been added to the database.")
         return True
-    except DatabaseError as e:
+    except psycopg.Error as e:
         logger.error(e)
         return False
 
@@ -119,17 +194,23 @@ def seed(
         password: str,
         dbname: str,
         logger: Optional[logging.Logger] = None,
+        use_external_pooler: bool = False,
 ) -> None:
     if logger is None:
         logger = logging.getLogger(__name__)
 
     users, tasks = generate_fake_data(users_number=10, tasks_number=100)
 
-    pg_client = PostgresClient(
-        PgConfig(dsn=f"postgresql://{user}:{password}@{host}:{port}/{dbname}", autocommit=True, min_size=1, max_size=5)
-    )
+    try:
+        pg_client = PostgresClient.get_or_create(
+            PgConfig(
+                dsn=f"postgresql://{user}:{password}@{host}:{port}/{dbname}", autocommit=False, min_size=1, max_size=5,
+                use_external_pooler=use_external_pooler,
+            )
+        )
+    except psycopg_pool.PoolTimeout as e:
+        logger.error(e)
+        return
 
     if fill_users_data(pg_client, users, logger):
         fill_tasks_data(pg_client, tasks, logger)
-
-    pg_client.close()
\ No newline at end of file
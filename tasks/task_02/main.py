@@ -11,12 +11,38 @@ import argparse
 from typing import Optional, Any
 from bson.objectid import ObjectId
 
-from pymongo import MongoClient
+from pymongo import MongoClient, ReturnDocument
 from pymongo.synchronous import database
 from pymongo.server_api import ServerApi
 from pymongo.errors import ConnectionFailure, OperationFailure
 
 
+# Shared MongoDB clients by URI. Not bounded: a process uses only a few URIs,
+# and an evicted client would keep its monitor threads and sockets open
+_clients: dict[str, MongoClient] = {}
+
+
+def _get_client(uri: str) -> MongoClient:
+    """
+    Return the shared MongoDB client for the URI (MongoClient is thread-safe and expensive to create).
+
+    :param uri: MongoDB connection URI
+    :return: MongoDB client
+    """
+    client = _clients.get(uri)
+    if client is None:
+        client = MongoClient(uri, server_api=ServerApi("1"))
+        _clients[uri] = client
+    return client
+
+
+# Databases with ensured indexes (URI, database name), to check them once per process
+_indexed_databases: set[tuple[str, str]] = set()
+
+# Error codes: duplicate key, index options conflict, index key specs conflict
+_INDEX_CONFLICT_CODES = {11000, 85, 86}
+
+
 class MongoDB:
 
     def __init__(self, uri: str, dbname: str):
@@ -46,22 +72,44 @@ class MongoDB:
         :return: MongoDB client and database instances
         """
         try:
-            client = MongoClient(self.uri, server_api=ServerApi("1"))
+            client = _get_client(self.uri)
             db = client.get_database(self.dbname)
+            self._ensure_indexes(db)
             return client, db
         except ConnectionFailure:
             raise RuntimeError("Server not available")
         except OperationFailure as e:
             raise RuntimeError(f"Connection failed: {str(e)}")
 
+    def _ensure_indexes(self, db: database.Database) -> None:
+        """
+        Create the index on the "name" field, used by every read/update/delete by name (once per process).
+        The index is unique, unless the collection already contains duplicate names.
+        Best-effort: if the index cannot be created (like without the createIndex privilege), the collection
+        is used without it and the creation is retried on the next connection.
+
+        :param db: MongoDB database instance
+        """
+        key = (self.uri, self.dbname)
+        if key in _indexed_databases:
+            return
+        try:
+            try:
+                db.cats.create_index("name", unique=True)
+            except OperationFailure as e:
+                if e.code not in _INDEX_CONFLICT_CODES:
+                    raise
+                db.cats.create_index("name")
+        except OperationFailure:
+            return
+        _indexed_databases.add(key)
+
     def _close(self) -> None:
         """
-        Close connection to a MongoDB host
+        Release the connection to a MongoDB host (the shared client stays open for reuse)
         """
-        if self.client is not None:
-            self.client.close()
-            self.db = None
-            self.client = None
+        self.db = None
+        self.client = None
 
     def __enter__(self) ->MongoDB:
         """
@@ -79,12 +127,6 @@ class MongoDB:
         """
         self._close()
 
-    def __del__(self) -> None:
-        """
-        Checks whether the connection to MongoDB and the database is closed. Close connection if opened/
-        """
-        self._close()
-
     def open(self) -> None:
         """
         Connect to a MongoDB host and get a database by name.
@@ -94,7 +136,7 @@ class MongoDB:
 
     def close(self) -> None:
         """
-        Close connection to a MongoDB host
+        Release the connection to a MongoDB host
         """
         self._close()
 
@@ -122,8 +164,10 @@ class MongoDB:
         """
         self._is_opened(raise_exception=True)
         try:
-            result = self.db.cats.insert_one({"name": name, "age": age, "features": features or []})
-            return self.find(result.inserted_id)
+            cat = {"name": name, "age": age, "features": features or []}
+            # insert_one() sets "_id" in the inserted document, no need to read it back
+            self.db.cats.insert_one(cat)
+            return cat
         except OperationFailure as e:
             raise RuntimeError(f"Operation failed: {str(e)}")
 
@@ -149,7 +193,7 @@ class MongoDB:
         """
         self._is_opened(raise_exception=True)
         try:
-            return [cat for cat in self.db.cats.find({})]
+            return list(self.db.cats.find({}, projection={"name": 1, "age": 1, "features": 1}).batch_size(1000))
         except OperationFailure as e:
             raise RuntimeError(f"Operation failed: {str(e)}")
 
@@ -164,10 +208,15 @@ class MongoDB:
         """
         self._is_opened(raise_exception=True)
         try:
+            update: dict[str, Any] = {}
             if age is not None:
-                self.db.cats.update_one({"name": name}, {"$set": {"age": age}})
+                update.setdefault("$set", {})["age"] = age
             if features is not None:
-                self.db.cats.update_one({"name": name}, {"$addToSet": {"features": {"$each": features}}})
+                update.setdefault("$addToSet", {})["features"] = {"$each": features}
+            if update:
+                return self.db.cats.find_one_and_update(
+                    {"name": name}, update, return_document=ReturnDocument.AFTER
+                )
             return self.read_one(name)
         except OperationFailure as e:
             raise RuntimeError(f"Operation failed: {str(e)}")
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+
+"""
+Tests for Task 2 MongoDB index creation (the database is replaced with a mock)
+"""
+
+from unittest import mock
+
+import pytest
+
+pytest.importorskip("pymongo")
+
+from pymongo.errors import OperationFailure
+
+from tasks.task_02 import main
+
+
+@pytest.fixture(autouse=True)
+def clear_indexed_databases():
+    main._indexed_databases.clear()
+    yield
+    main._indexed_databases.clear()
+
+
+def test_ensure_indexes_creates_unique_index_once():
+    db = mock.MagicMock()
+    cats = main.MongoDB("mongodb://localhost", "cats_db")
+
+    cats._ensure_indexes(db)
+    cats._ensure_indexes(db)
+
+    db.cats.create_index.assert_called_once_with("name", unique=True)
+
+
+def test_ensure_indexes_falls_back_to_plain_index_on_duplicates():
+    db = mock.MagicMock()
+    db.cats.create_index.side_effect = [OperationFailure("duplicate key", code=11000), "name_1"]
+    cats = main.MongoDB("mongodb://localhost", "cats_db")
+
+    cats._ensure_indexes(db)
+
+    assert db.cats.create_index.call_args_list == [mock.call("name", unique=True), mock.call("name")]
+    assert ("mongodb://localhost", "cats_db") in main._indexed_databases
+
+
+def test_ensure_indexes_is_best_effort_without_privilege():
+    db = mock.MagicMock()
+    db.cats.create_index.side_effect = OperationFailure("not authorized", code=13)
+    cats = main.MongoDB("mongodb://localhost", "cats_db")
+
+    cats._ensure_indexes(db)
+
+    assert ("mongodb://localhost", "cats_db") not in main._indexed_databases